@@ -165,9 +165,7 @@ class Game:
             In test environment (pytest), card display is suppressed.
         """
         all_cards = self.generate_all_cards()
-        print(f"len all cards: {len(all_cards)}")
         available_cards = {card.id: card for card in all_cards}
-        print(f"len available cards: {len(available_cards)}")
         hands: List[List[Card]] = [[], []]
 
         # Manual selection for both players
@@ -206,7 +204,6 @@ class Game:
         # Create deck from remaining cards
         deck = list(available_cards.values())
         random.shuffle(deck)
-        print(f"len deck: {len(deck)}")
 
         # Initialize game state with empty fields for both players
         fields: List[List[Card]] = [[], []]
@@ -288,7 +285,6 @@ class Game:
                         rank=rank,
                     )
                 )
-        print(f"len generate all cards: {len(cards)}")
         return cards
 
     def generate_shuffled_deck(self) -> List[Card]:
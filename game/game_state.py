@@ -696,7 +696,7 @@ class GameState:
 
         # check if the player has won
         if self.get_player_score(self.turn) >= self.get_player_target(self.turn):
-            print(
+            log_print(
                 f"Player {self.turn} wins! Score: {self.get_player_score(self.turn)} points (target: {self.get_player_target(self.turn)} with {len([c for c in self.fields[self.turn] if c.rank == Rank.KING])} Kings)"
             )
             self.status = "win"
@@ -836,8 +836,6 @@ class GameState:
         return True, None
 
     def apply_one_off_effect(self, card: Card) -> None:
-        print(f"Applying one off effect for {card}")
-        print(len(self.hands[self.turn]))
         if card.rank == Rank.ACE:
             # Clear all point cards from all players' fields
             for player_field in self.fields:
@@ -852,12 +850,10 @@ class GameState:
         elif card.rank == Rank.THREE:
             # Allow player to take a card from the discard pile
             if not self.discard_pile:
-                print("No cards in discard pile to take")
+                log_print("No cards in discard pile to take")
                 return
 
             # Get the player's choice
-            print(f"self.use_ai: {self.use_ai}")
-            print(f"self.turn: {self.turn}")
             chosen_card = None
             if self.use_ai and self.turn == 1:
                 if self.ai_player is not None:
@@ -865,9 +861,9 @@ class GameState:
                     if chosen_card in self.discard_pile:
                         self.discard_pile.remove(chosen_card)
                     self.hands[self.turn].append(chosen_card)
-                    print(f"AI chose {chosen_card} from discard pile")
+                    log_print(f"AI chose {chosen_card} from discard pile")
                 else:
-                    print("Warning: AI player is None, cannot choose card.")
+                    log_print("Warning: AI player is None, cannot choose card.")
                     if self.discard_pile:
                         chosen_card = self.discard_pile.pop(0)
                         self.hands[self.turn].append(chosen_card)
@@ -887,9 +883,9 @@ class GameState:
                     chosen_card = self.discard_pile.pop(index)
                     chosen_card.clear_player_info()
                     self.hands[self.turn].append(chosen_card)
-                    print(f"Took {chosen_card} from discard pile")
+                    log_print(f"Took {chosen_card} from discard pile")
                 else:
-                    print("Invalid selection")
+                    log_print("Invalid selection")
             else:
                 # Defer selection for API-driven input.
                 self.resolving_three = True
@@ -901,8 +897,6 @@ class GameState:
             # if opponent only has 1 card, they can discard that one
 
             # Get the player's choice
-            print(f"self.use_ai: {self.use_ai}")
-            print(f"self.turn: {self.turn}")
             chosen_cards = None
             opponent = (self.turn + 1) % len(self.hands)
             discard_prompt = f"player {opponent} must discard 2 cards"
@@ -927,7 +921,7 @@ class GameState:
                             self.discard_pile.append(chosen_card)
                             chosen_card.clear_player_info()
                 else:
-                    print("Warning: AI player is None, cannot choose cards.")
+                    log_print("Warning: AI player is None, cannot choose cards.")
                     num_to_discard = min(2, len(self.hands[opponent]))
                     for _ in range(num_to_discard):
                         if self.hands[opponent]:
@@ -1054,7 +1048,7 @@ class GameState:
 
             # Check for instant win with King (if points already meet new target)
             if card.rank == Rank.KING and self.is_winner(self.turn):
-                print(
+                log_print(
                     f"Player {self.turn} wins! Score: {self.get_player_score(self.turn)} points (target: {self.get_player_target(self.turn)} with {len([c for c in self.fields[self.turn] if c.rank == Rank.KING])} Kings)"
                 )
                 self.status = "win"
@@ -1089,7 +1083,7 @@ class GameState:
 
             winner = self.winner()
             if winner is not None:
-                print(
+                log_print(
                     f"Player {winner} wins! Score: {self.get_player_score(winner)} points (target: {self.get_player_target(winner)} with {len([c for c in self.fields[winner] if c.rank == Rank.KING])} Kings)"
                 )
                 self.status = "win"
@@ -1241,7 +1235,6 @@ class GameState:
         # Get point cards from hand (Ace to Ten)
         point_cards = [card for card in hand if card.point_value() <= Rank.TEN.value[1]]
 
-        print(f"opponent_points: {opponent_points}")
         # For each point card in opponent's field
         for opponent_card in opponent_points:
             # For each point card in player's hand
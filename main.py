@@ -11,6 +11,7 @@ import io
 import logging
 import os
 import time
+from dataclasses import dataclass
 from typing import List, Optional, Tuple, Union
 
 from game.action import Action  # Import Action
@@ -25,6 +26,28 @@ HISTORY_DIR = "game_history"
 os.makedirs(HISTORY_DIR, exist_ok=True)
 
 
+@dataclass(frozen=True)
+class GameConfig:
+    """Preset answers to the setup and wrap-up prompts of main().
+
+    Passing a GameConfig to main() runs a single game without asking any of
+    these questions; only in-game input (card selection, actions) is read.
+
+    Attributes:
+        use_ai (bool): Whether Player 1 is the AI.
+        load_game (Optional[str]): Saved game file to load instead of dealing a new game.
+        manual_selection (bool): Whether to manually select the initial cards.
+        save_initial (bool): Whether to save the initial game state.
+        save_history (bool): Whether to save the game history when the game ends.
+    """
+
+    use_ai: bool = False
+    load_game: Optional[str] = None
+    manual_selection: bool = False
+    save_initial: bool = False
+    save_history: bool = False
+
+
 def setup_logging() -> Tuple[logging.Logger, io.StringIO]:
     """Set up logging configuration for game history capture.
 
@@ -153,34 +176,48 @@ def select_saved_game() -> Union[str, None]:
             print("Please enter a number or 'cancel'.")
 
 
-async def initialize_game(use_ai: bool, ai_player: Optional[AIPlayer]) -> Game:
+async def initialize_game(
+    use_ai: bool, ai_player: Optional[AIPlayer], config: Optional[GameConfig] = None
+) -> Game:
     """Initialize a new game or load a saved game.
 
     Args:
         use_ai (bool): Whether to use AI player.
         ai_player (Optional[AIPlayer]): The AI player instance if use_ai is True.
+        config (Optional[GameConfig]): Preset answers to the setup prompts. If None,
+            the user is asked instead.
 
     Returns:
         Game: The initialized game instance.
     """
-    if get_yes_no_input("Would you like to load a saved game?"):
+    filename: Optional[str] = None
+    if config is not None:
+        filename = config.load_game
+    elif get_yes_no_input("Would you like to load a saved game?"):
         filename = select_saved_game()
-        if filename:
-            try:
-                game = Game(load_game=filename, ai_player=ai_player)
-                log_print("Game loaded successfully!")
-                return game
-            except Exception as e:
-                log_print(f"Error loading game: {e}")
-                log_print("Starting new game instead.")
-
-    manual_selection = get_yes_no_input(
-        "Would you like to manually select initial cards?"
-    )
+    if filename:
+        try:
+            game = Game(load_game=filename, ai_player=ai_player)
+            log_print("Game loaded successfully!")
+            return game
+        except Exception as e:
+            log_print(f"Error loading game: {e}")
+            log_print("Starting new game instead.")
+
+    if config is not None:
+        manual_selection = config.manual_selection
+    else:
+        manual_selection = get_yes_no_input(
+            "Would you like to manually select initial cards?"
+        )
     log_print(f"use_ai: {use_ai}")
     game = Game(manual_selection=manual_selection, ai_player=ai_player)
 
-    if get_yes_no_input("Would you like to save this initial game state?"):
+    if config is not None:
+        save_initial = config.save_initial
+    else:
+        save_initial = get_yes_no_input("Would you like to save this initial game state?")
+    if save_initial:
         save_initial_game_state(game)
 
     return game
@@ -473,17 +510,26 @@ def display_game_state(game: Game) -> None:
     game.game_state.print_state(hide_player_hand=hide_hand)
 
 
-async def main() -> None:
-    """Main entry point for the game."""
+async def main(config: Optional[GameConfig] = None) -> None:
+    """Main entry point for the game.
+
+    Args:
+        config (Optional[GameConfig]): Preset answers to the setup and wrap-up
+            prompts. If given, a single game is played without asking them;
+            if None, every choice is prompted for.
+    """
     logger, log_stream = setup_logging()
-    use_ai = get_yes_no_input(
-        "Would you like to play against AI (as Player 1)?"
-    )  # Changed to Player 1
+    if config is not None:
+        use_ai = config.use_ai
+    else:
+        use_ai = get_yes_no_input(
+            "Would you like to play against AI (as Player 1)?"
+        )  # Changed to Player 1
     ai_player = AIPlayer() if use_ai else None
 
     while True:
         # Pass Optional[AIPlayer] to initialize_game
-        game = await initialize_game(use_ai, ai_player)
+        game = await initialize_game(use_ai, ai_player, config)
 
         log_print("\nStarting game...")
         # display_game_state(game) # Initial display happens in game_loop
@@ -498,12 +544,18 @@ async def main() -> None:
 
         # game.game_state.print_state(hide_player_hand=1 if use_ai else None)
 
-        if get_yes_no_input("Would you like to save the game history?"):
+        if config is not None:
+            save_history = config.save_history
+        else:
+            save_history = get_yes_no_input("Would you like to save the game history?")
+        if save_history:
             save_game_history(log_stream.getvalue().splitlines())
 
         # Changed condition to check if AI was used for replay prompt
-        keep_playing = use_ai and get_yes_no_input(
-            "Would you like to play again with AI?"
+        keep_playing = (
+            config is None
+            and use_ai
+            and get_yes_no_input("Would you like to play again with AI?")
         )
         if not keep_playing:
             break
@@ -2,8 +2,6 @@ import unittest
 from typing import Any, Dict, List
 from unittest.mock import Mock, patch
 
-import pytest
-
 from game.action import Action, ActionType
 from game.card import Card, Purpose, Rank, Suit
 from game.game import Game
@@ -11,7 +9,6 @@ from game.game_state import GameState
 
 
 class TestGame(unittest.TestCase):
-    @pytest.mark.timeout(5)
     def test_initialize_with_random_hands(self) -> None:
         """Test that random initialization creates valid hands."""
         game = Game(manual_selection=False)
@@ -35,7 +32,6 @@ class TestGame(unittest.TestCase):
         self.assertEqual(len(all_cards), len(unique_cards))
         self.assertEqual(len(all_cards), 52)  # Total number of cards
 
-    @pytest.mark.timeout(5)
     @patch("builtins.input")
     @patch("builtins.print")
     def test_manual_selection_full_hands(self, mock_print: Mock, mock_input: Mock) -> None:
@@ -77,7 +73,6 @@ class TestGame(unittest.TestCase):
         # Verify print was called
         self.assertTrue(mock_print.called)
 
-    @pytest.mark.timeout(5)
     @patch("builtins.input")
     @patch("builtins.print")
     def test_manual_selection_early_done(self, mock_print: Mock, mock_input: Mock) -> None:
@@ -111,7 +106,6 @@ class TestGame(unittest.TestCase):
         self.assertEqual(len(all_cards), len(unique_cards))
         self.assertEqual(len(all_cards), 52)
 
-    @pytest.mark.timeout(5)
     @patch("builtins.input")
     @patch("builtins.print")
     def test_manual_selection_invalid_inputs(self, mock_print: Mock, mock_input: Mock) -> None:
@@ -146,7 +140,6 @@ class TestGame(unittest.TestCase):
         self.assertEqual(len(all_cards), len(unique_cards))
         self.assertEqual(len(all_cards), 52)
 
-    @pytest.mark.timeout(5)
     def test_generate_all_cards(self) -> None:
         """Test that generate_all_cards creates a complete deck."""
         game = Game()
@@ -165,7 +158,6 @@ class TestGame(unittest.TestCase):
         unique_cards = set(str(card) for card in cards)
         self.assertEqual(len(cards), len(unique_cards))
 
-    @pytest.mark.timeout(5)
     def test_fill_remaining_slots(self) -> None:
         """Test that fill_remaining_slots correctly fills partial hands."""
         game = Game()
@@ -200,7 +192,6 @@ class TestGame(unittest.TestCase):
         unique_cards = set(str(card) for card in all_hand_cards)
         self.assertEqual(len(all_hand_cards), len(unique_cards))
 
-    @pytest.mark.timeout(5)
     def test_save_load_game(self) -> None:
         """Test saving and loading game state."""
         # Create a game with known state
@@ -239,7 +230,6 @@ class TestGame(unittest.TestCase):
         if os.path.exists(save_path):
             os.remove(save_path)
 
-    @pytest.mark.timeout(5)
     def test_list_saved_games(self) -> None:
         """Test listing saved games."""
         # Create some test save files
@@ -264,13 +254,11 @@ class TestGame(unittest.TestCase):
             if os.path.exists(save_path):
                 os.remove(save_path)
 
-    @pytest.mark.timeout(5)
     def test_load_nonexistent_game(self) -> None:
         """Test loading a non-existent save file."""
         with self.assertRaises(FileNotFoundError):
             Game(load_game="nonexistent_save.json")
 
-    @pytest.mark.timeout(5)
     def test_scuttle_update_state(self) -> None:
         """Test the return values of update_state for scuttle actions."""
         game = Game()
@@ -314,7 +302,6 @@ class TestGame(unittest.TestCase):
         self.assertIn(scuttle_card, game.game_state.discard_pile)  # Both cards moved to
         self.assertIn(target_card, game.game_state.discard_pile)  # discard pile
 
-    @pytest.mark.timeout(5)
     def test_scuttle_with_equal_points(self) -> None:
         """Test scuttle with equal point values but higher suit."""
         game = Game()
@@ -353,7 +340,6 @@ class TestGame(unittest.TestCase):
         self.assertIn(scuttle_card, game.game_state.discard_pile)
         self.assertIn(target_card, game.game_state.discard_pile)
 
-    @pytest.mark.timeout(5)
     def test_scuttle_with_lower_suit_fails(self) -> None:
         """Test that scuttle fails when using a lower suit on same rank."""
         game = Game()
@@ -389,7 +375,6 @@ class TestGame(unittest.TestCase):
         self.assertNotIn(scuttle_card, game.game_state.discard_pile)  # Cards not in
         self.assertNotIn(target_card, game.game_state.discard_pile)  # discard pile
 
-    @pytest.mark.timeout(5)
     def test_play_king_reduces_target(self) -> None:
         """Test that playing a King reduces the target score."""
         game = Game()
@@ -415,7 +400,6 @@ class TestGame(unittest.TestCase):
         self.assertFalse(should_stop)
         self.assertIsNone(winner)
 
-    @pytest.mark.timeout(5)
     def test_play_king_instant_win(self) -> None:
         """Test that playing a King can lead to instant win."""
         game = Game()
@@ -454,7 +438,6 @@ class TestGame(unittest.TestCase):
         self.assertTrue(should_stop)
         self.assertEqual(winner, 0)
 
-    @pytest.mark.timeout(5)
     def test_play_king_on_opponents_turn(self) -> None:
         """Test that Kings can only be played on your own turn."""
         game = Game()
@@ -485,7 +468,6 @@ class TestGame(unittest.TestCase):
         self.assertNotIn(king, game.game_state.fields[0])
         self.assertEqual(game.game_state.get_player_target(0), 21)
 
-    @pytest.mark.timeout(5)
     def test_play_multiple_kings(self) -> None:
         """Test playing multiple Kings reduces target score correctly."""
         game = Game()
@@ -0,0 +1,91 @@
+from typing import Any, Callable, List, Optional, Sequence
+
+import pytest
+
+from game.card import Card
+from game.game import Game
+from game.utils import log_print
+from main import GameConfig, main as run_main
+from tests.test_main.test_main_base import DeckBuilder, MainTestBase, ScenarioRunner
+
+# Human-only game with manually selected hands and nothing saved, so scripted
+# inputs start at the card selection and end with the last game action
+SCENARIO_CONFIG = GameConfig(manual_selection=True)
+
+
+def _fresh_cards(cards: Sequence[Card]) -> List[Card]:
+    # Hands are shared module-level tuples and Cards are mutated during play
+    # (played_by, purpose, attachments), so each deck gets its own copies
+    return [Card(card.id, card.suit, card.rank) for card in cards]
+
+
+@pytest.fixture
+def make_test_deck() -> DeckBuilder:
+    """Return a builder for a fresh test deck that deals the given hands first."""
+
+    def _build(p0_cards: Sequence[Card], p1_cards: Sequence[Card]) -> List[Card]:
+        return MainTestBase.generate_test_deck(
+            _fresh_cards(p0_cards), _fresh_cards(p1_cards)
+        )
+
+    return _build
+
+
+def _capture_games(
+    mp: pytest.MonkeyPatch, logger: Optional[Callable[..., Any]] = None
+) -> List[Game]:
+    """Patch Game.__init__ to record every Game built, most recent last.
+
+    If logger is given, it is used for Games constructed without one.
+    """
+    captured: List[Game] = []
+    original_init = Game.__init__
+
+    def capture_game_init(self: Game, *args: Any, **kwargs: Any) -> None:
+        if logger is not None:
+            kwargs.setdefault("logger", logger)
+        original_init(self, *args, **kwargs)
+        captured.append(self)
+
+    mp.setattr(Game, "__init__", capture_game_init)
+    return captured
+
+
+@pytest.fixture
+def game_capture(monkeypatch: pytest.MonkeyPatch) -> List[Game]:
+    """Record every Game constructed during the test, most recent last."""
+    return _capture_games(monkeypatch)
+
+
+@pytest.fixture(scope="module")
+def run_scenario() -> ScenarioRunner:
+    """Return a runner that plays one game through main.py and hands back its Game.
+
+    The runner is built once per module; each call still gets a fresh game,
+    patched deck, input stream and Game capture. It is a coroutine so tests
+    can await it on the session event loop rather than spinning up a new
+    loop per game with asyncio.run(). The game's output, including the board
+    display, goes through the "cuttle" logger to a NullHandler, and the input
+    handler's menus are dropped by silent_print, since the checks only look
+    at the Game itself.
+    Each game runs with SCENARIO_CONFIG, so main() asks none of its setup
+    prompts. A game that stalls is stopped by the timeout in pytest.ini.
+    """
+
+    async def _run(inputs: Sequence[str], deck: List[Card]) -> Game:
+        with (
+            pytest.MonkeyPatch.context() as mp,
+            MainTestBase.fake_deck(deck),
+            MainTestBase.fast_input(inputs),
+            MainTestBase.silent_print(),
+            MainTestBase.null_logging(),
+        ):
+            # Game binds builtins.print as its default logger at import time,
+            # out of silent_print's reach, so send its output to "cuttle" too
+            captured = _capture_games(mp, logger=log_print)
+            await run_main(SCENARIO_CONFIG)
+
+        assert captured, "Game object was not captured"
+        return captured[-1]
+
+    return _run
@@ -1,3 +1,8 @@
+"""PYTEST_DONT_REWRITE
+
+Ace one-off games driven through main.py.
+"""
+
 import asyncio
 import logging
 from typing import Any, List
@@ -8,59 +13,61 @@ import pytest
 from game.action import ActionType
 from game.card import Card, Rank, Suit
 from game.game import Game
-from tests.test_main.test_main_base import MainTestBase, print_and_capture
+from main import main as run_main
+from tests.test_main.test_main_base import (
+    SELECT_HANDS_IN_ORDER,
+    DeckBuilder,
+    MainTestBase,
+)
+
+pytestmark = pytest.mark.e2e
+
+# Inputs before the first game action when main() asks its setup prompts:
+# no AI, no saved game, manual selection, both hands picked in deck order,
+# then no save of the initial state
+_BOOT_PROMPTS = ("n", "n", "y") + SELECT_HANDS_IN_ORDER + ("n",)
+
+# Starting hands shared across the Ace tests
+_P0_BASE = (
+    Card("1", Suit.HEARTS, Rank.ACE),  # Ace of Hearts
+    Card("2", Suit.SPADES, Rank.KING),  # King of Spades
+    Card("3", Suit.HEARTS, Rank.TEN),  # 10 of Hearts
+    Card("4", Suit.DIAMONDS, Rank.FIVE),  # 5 of Diamonds
+    Card("5", Suit.CLUBS, Rank.TWO),  # 2 of Clubs
+)
+_P1_BASE = (
+    Card("6", Suit.DIAMONDS, Rank.NINE),  # 9 of Diamonds (points)
+    Card("7", Suit.CLUBS, Rank.EIGHT),  # 8 of Clubs (face)
+    Card("8", Suit.HEARTS, Rank.SEVEN),  # 7 of Hearts (points)
+    Card("9", Suit.SPADES, Rank.FIVE),  # 5 of Spades
+    Card("10", Suit.DIAMONDS, Rank.FOUR),  # 4 of Diamonds
+    Card("11", Suit.CLUBS, Rank.THREE),  # 3 of Clubs
+)
+# Player 0 holds a 3 of Clubs instead of the 2 of Clubs
+_P0_COUNTERED = _P0_BASE[:4] + (Card("5", Suit.CLUBS, Rank.THREE),)
+# Player 1 holds a 2 of Clubs to counter with instead of the 3 of Clubs
+_P1_COUNTER = _P1_BASE[:5] + (Card("11", Suit.CLUBS, Rank.TWO),)
 
 
 class TestMainAce(MainTestBase):
-    @pytest.mark.timeout(5)
     @patch("builtins.input")
     @patch("builtins.print")
     @patch("game.game.Game.generate_all_cards")
     def test_play_ace_through_main(
-        self, mock_generate_cards: Mock, mock_print: Mock, mock_input: Mock
+        self,
+        mock_generate_cards: Mock,
+        mock_print: Mock,
+        mock_input: Mock,
+        game_capture: List[Game],
+        make_test_deck: DeckBuilder,
     ) -> None:
         """Test playing an Ace as a one-off through main.py to destroy point cards."""
-        # Set up print mock to both capture and display
-        mock_print.side_effect = print_and_capture
-
         # Create test deck with specific cards
-        p0_cards = [
-            Card("1", Suit.HEARTS, Rank.ACE),  # Ace of Hearts
-            Card("2", Suit.SPADES, Rank.KING),  # King of Spades
-            Card("3", Suit.HEARTS, Rank.TEN),  # 10 of Hearts
-            Card("4", Suit.DIAMONDS, Rank.FIVE),  # 5 of Diamonds
-            Card("5", Suit.CLUBS, Rank.TWO),  # 2 of Clubs
-        ]
-        p1_cards = [
-            Card("6", Suit.DIAMONDS, Rank.NINE),  # 9 of Diamonds (points)
-            Card("7", Suit.CLUBS, Rank.EIGHT),  # 8 of Clubs (face)
-            Card("8", Suit.HEARTS, Rank.SEVEN),  # 7 of Hearts (points)
-            Card("9", Suit.SPADES, Rank.FIVE),  # 5 of Spades
-            Card("10", Suit.DIAMONDS, Rank.FOUR),  # 4 of Diamonds
-            Card("11", Suit.CLUBS, Rank.THREE),  # 3 of Clubs
-        ]
-        test_deck = self.generate_test_deck(p0_cards, p1_cards)
+        test_deck = make_test_deck(_P0_BASE, _P1_BASE)
         mock_generate_cards.return_value = test_deck
 
         # Mock sequence of inputs for the entire game
-        mock_inputs = [
-            "n",  # Use AI?
-            "n",  # Don't load saved game
-            "y",  # Use manual selection
-            # Player 0 selects cards
-            "0",  # Select Ace of Hearts
-            "0",  # Select King of Spades
-            "0",  # Select 10 of Hearts
-            "0",  # Select 5 of Diamonds
-            "0",  # Select 2 of Clubs
-            # Player 1 selects cards
-            "0",  # Select 9 of Diamonds
-            "0",  # Select 8 of Clubs
-            "0",  # Select 7 of Hearts
-            "0",  # Select 5 of Spades
-            "0",  # Select 4 of Diamonds
-            "0",  # Select 3 of Clubs
-            "n",  # Don't save initial state
+        mock_inputs = _BOOT_PROMPTS + (
             # Game actions
             "Ten of Hearts as points",  # p0 Play 10 of Hearts (points)
             "Nine of Diamonds as points",  # p1 Play 9 of Diamonds (points)
@@ -70,32 +77,15 @@ class TestMainAce(MainTestBase):
             "Resolve",  # p1 resolves
             "end game",  # End game
             "n",  # Don't save final game state
-        ]
+        )
         self.setup_mock_input(mock_input, mock_inputs)
         
-        # Capture the game object using a different approach - monkey patch Game class
-        captured_game = None
-        original_init = Game.__init__
-        
-        def capture_game_init(self, *args, **kwargs):
-            nonlocal captured_game
-            result = original_init(self, *args, **kwargs)
-            captured_game = self
-            return result
-        
-        # Monkey patch temporarily
-        Game.__init__ = capture_game_init
-        
-        try:
-            # Run the game
-            from main import main
-            asyncio.run(main())
-        finally:
-            # Restore original
-            Game.__init__ = original_init
+        # Run the game
+        asyncio.run(run_main())
 
         # Verify we captured the game object
-        assert captured_game is not None, "Game object was not captured"
+        assert game_capture, "Game object was not captured"
+        captured_game = game_capture[-1]
         
         # Access the game history
         history = captured_game.game_state.game_history
@@ -151,55 +141,24 @@ class TestMainAce(MainTestBase):
         assert Rank.KING in p0_hand_ranks and Rank.TWO in p0_hand_ranks, "Player 0 should have King and Two"
         assert Rank.EIGHT in p1_hand_ranks, "Player 1 should have Eight in hand"
 
-    @pytest.mark.timeout(5)
     @patch("builtins.input")
     @patch("builtins.print")
     @patch("game.game.Game.generate_all_cards")
     def test_play_ace_with_countering_through_main(
-        self, mock_generate_cards: Mock, mock_print: Mock, mock_input: Mock
+        self,
+        mock_generate_cards: Mock,
+        mock_print: Mock,
+        mock_input: Mock,
+        game_capture: List[Game],
+        make_test_deck: DeckBuilder,
     ) -> None:
         """Test playing an Ace as a one-off through main.py and getting countered."""
-        # Set up print mock to both capture and display
-        mock_print.side_effect = print_and_capture
-
         # Create test deck with specific cards
-        p0_cards = [
-            Card("1", Suit.HEARTS, Rank.ACE),  # Ace of Hearts
-            Card("2", Suit.SPADES, Rank.KING),  # King of Spades
-            Card("3", Suit.HEARTS, Rank.TEN),  # 10 of Hearts
-            Card("4", Suit.DIAMONDS, Rank.FIVE),  # 5 of Diamonds
-            Card("5", Suit.CLUBS, Rank.THREE),  # 3 of Clubs
-        ]
-        p1_cards = [
-            Card("6", Suit.DIAMONDS, Rank.NINE),  # 9 of Diamonds (points)
-            Card("7", Suit.CLUBS, Rank.EIGHT),  # 8 of Clubs (face)
-            Card("8", Suit.HEARTS, Rank.SEVEN),  # 7 of Hearts (points)
-            Card("9", Suit.SPADES, Rank.FIVE),  # 5 of Spades
-            Card("10", Suit.DIAMONDS, Rank.FOUR),  # 4 of Diamonds
-            Card("11", Suit.CLUBS, Rank.TWO),  # 2 of Clubs
-        ]
-        test_deck = self.generate_test_deck(p0_cards, p1_cards)
+        test_deck = make_test_deck(_P0_COUNTERED, _P1_COUNTER)
         mock_generate_cards.return_value = test_deck
 
         # Mock sequence of inputs for the entire game
-        mock_inputs = [
-            "n",  # Use AI?
-            "n",  # Don't load saved game
-            "y",  # Use manual selection
-            # Player 0 selects cards
-            "0",  # Select Ace of Hearts
-            "0",  # Select King of Spades
-            "0",  # Select 10 of Hearts
-            "0",  # Select 5 of Diamonds
-            "0",  # Select 2 of Clubs
-            # Player 1 selects cards
-            "0",  # Select 9 of Diamonds
-            "0",  # Select 8 of Clubs
-            "0",  # Select 7 of Hearts
-            "0",  # Select 5 of Spades
-            "0",  # Select 4 of Diamonds
-            "0",  # Select 3 of Clubs
-            "n",  # Don't save initial state
+        mock_inputs = _BOOT_PROMPTS + (
             # Game actions
             "Ten of Hearts as points",  # p0 Play 10 of Hearts (points)
             "Nine of Diamonds as points",  # p1 Play 9 of Diamonds (points)
@@ -210,32 +169,15 @@ class TestMainAce(MainTestBase):
             "Resolve",  # p0 resolves
             "end game",  # End game
             "n",  # Don't save final game state
-        ]
+        )
         self.setup_mock_input(mock_input, mock_inputs)
         
-        # Capture the game object using a different approach - monkey patch Game class
-        captured_game = None
-        original_init = Game.__init__
-        
-        def capture_game_init(self, *args, **kwargs):
-            nonlocal captured_game
-            result = original_init(self, *args, **kwargs)
-            captured_game = self
-            return result
-        
-        # Monkey patch temporarily
-        Game.__init__ = capture_game_init
-        
-        try:
-            # Run the game
-            from main import main
-            asyncio.run(main())
-        finally:
-            # Restore original
-            Game.__init__ = original_init
+        # Run the game
+        asyncio.run(run_main())
 
         # Verify we captured the game object
-        assert captured_game is not None, "Game object was not captured"
+        assert game_capture, "Game object was not captured"
+        captured_game = game_capture[-1]
         
         # Access the game history
         history = captured_game.game_state.game_history
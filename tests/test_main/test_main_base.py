@@ -1,39 +1,54 @@
+import builtins
 import io
 import logging
 import sys
-import unittest
-from typing import Any, List, Optional, Tuple
+from collections import defaultdict
+from contextlib import contextmanager
+from itertools import product
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    DefaultDict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 from unittest.mock import Mock
 
 import pytest
 
+import main as main_module
+from game.action import ActionType
 from game.card import Card, Rank, Suit
+from game.game import Game
+from game.game_history import GameHistory, GameHistoryEntry
 
 # Set up logging
 log_stream = io.StringIO()
 logging.basicConfig(
     stream=log_stream, level=logging.DEBUG, format="%(message)s", force=True
 )
-logger = logging.getLogger(__name__)
-
-
-def print_and_capture(*args: Any, **kwargs: Any) -> str:
-    """Helper function to both print to stdout and log the output"""
-    # Convert args to string
-    output = " ".join(str(arg) for arg in args)
-    # Add newline if not present
-    if not output.endswith("\n"):
-        output += "\n"
-    # Write to stdout
-    if sys.__stdout__ is not None:
-        sys.__stdout__.write(output)
-    # Log the output (strip to avoid double newlines)
-    logger.info(output.rstrip())
-    # Return the output for the mock to capture
-    return output.rstrip()
-
-
-class MainTestBase(unittest.TestCase):
+
+# Suit/rank pairs in the order filler cards are drawn from; fixed, so built once
+_FILLER_PAIRS: Tuple[Tuple[Suit, Rank], ...] = tuple(product(Suit, Rank))
+
+# Inputs before the first game action when main() runs with manual selection:
+# each player's five and six card hands picked in deck order
+SELECT_HANDS_IN_ORDER: Tuple[str, ...] = ("0",) * 5 + ("0",) * 6
+
+# Builds a test deck that deals the given Player 0 and Player 1 hands first
+DeckBuilder = Callable[[Sequence[Card], Sequence[Card]], List[Card]]
+# Plays a game through main.py with the given inputs and deck, returning the Game
+ScenarioRunner = Callable[[Sequence[str], List[Card]], Awaitable[Game]]
+
+
+class MainTestBase:
+    """Shared pytest-style helpers for tests that drive a game through main.py."""
+
     original_stdout: Any
     original_stderr: Any
     stdout_capture: io.StringIO
@@ -59,10 +74,86 @@ class MainTestBase(unittest.TestCase):
         self.stdout_capture.close()
         self.stderr_capture.close()
 
-    def setup_mock_input(self, mock_input_target: Mock, inputs: List[str]) -> None:
+    def setup_mock_input(self, mock_input_target: Mock, inputs: Iterable[str]) -> None:
         """Helper to set up the mock input sequence."""
         self.mock_input = mock_input_target
-        self.mock_input.side_effect = inputs
+        self.mock_input.side_effect = iter(inputs)
+
+    @staticmethod
+    @contextmanager
+    def fast_input(responses: Iterable[str]) -> Iterator[None]:
+        """Temporarily replace builtins.input with a plain iterator over responses.
+
+        Unlike patching with a Mock, no call records are kept, so each input()
+        during the game costs a single next() call.
+        """
+        it = iter(responses)
+        original_input = builtins.input
+        builtins.input = lambda *args, **kwargs: next(it)
+        try:
+            yield
+        finally:
+            builtins.input = original_input
+
+    @staticmethod
+    @contextmanager
+    def silent_print() -> Iterator[None]:
+        """Temporarily make builtins.print discard its arguments."""
+        original_print = builtins.print
+        builtins.print = lambda *args, **kwargs: None
+        try:
+            yield
+        finally:
+            builtins.print = original_print
+
+    @staticmethod
+    @contextmanager
+    def null_logging() -> Iterator[None]:
+        """Temporarily send the game's "cuttle" logger output to a NullHandler.
+
+        main() calls setup_logging() on every run, which would swap the
+        handlers back to a console and a string stream, so it is patched to
+        hand back the silenced logger instead.
+        """
+        cuttle_logger = logging.getLogger("cuttle")
+        original_handlers = cuttle_logger.handlers
+        original_propagate = cuttle_logger.propagate
+        original_setup = main_module.setup_logging
+
+        def setup_null_logging() -> Tuple[logging.Logger, io.StringIO]:
+            return cuttle_logger, io.StringIO()
+
+        cuttle_logger.handlers = [logging.NullHandler()]
+        cuttle_logger.propagate = False
+        main_module.setup_logging = setup_null_logging
+        try:
+            yield
+        finally:
+            main_module.setup_logging = original_setup
+            cuttle_logger.handlers = original_handlers
+            cuttle_logger.propagate = original_propagate
+
+    @staticmethod
+    @contextmanager
+    def fake_deck(deck: List[Card]) -> Iterator[None]:
+        """Temporarily make Game.generate_all_cards return the given deck."""
+
+        def generate_all_cards(self_: Game) -> List[Card]:
+            return deck
+
+        with pytest.MonkeyPatch.context() as mp:
+            mp.setattr(Game, "generate_all_cards", generate_all_cards)
+            yield
+
+    @staticmethod
+    def index_history(
+        history: GameHistory
+    ) -> DefaultDict[ActionType, List[GameHistoryEntry]]:
+        """Group history entries by action type in a single pass."""
+        by_type: DefaultDict[ActionType, List[GameHistoryEntry]] = defaultdict(list)
+        for entry in history.entries:
+            by_type[entry.action_type].append(entry)
+        return by_type
 
     def get_captured_stdout(self) -> str:
         """Returns captured standard output."""
@@ -91,43 +182,15 @@ class MainTestBase(unittest.TestCase):
         print(output)
         print("--- End Game Output ---\n")
 
-    def generate_test_deck(self, p0_cards: List[Card], p1_cards: List[Card], num_filler: int = 41) -> List[Card]:
+    @staticmethod
+    def generate_test_deck(p0_cards: Sequence[Card], p1_cards: Sequence[Card], num_filler: int = 41) -> List[Card]:
         """Generate a test deck ensuring specific player hands first."""
         deck = list(p0_cards) + list(p1_cards)
-        existing_cards: set[str] = set(str(c) for c in deck)
-
-        # Add filler cards, avoiding duplicates
-        filler_count = 0
-        card_id = len(deck) + 1
-        for suit in Suit:
-            for rank in Rank:
-                if filler_count >= num_filler:
-                    break
-                card_str = f"{rank.value}{suit.value}"  # Use a consistent string representation
-                if card_str not in existing_cards:
-                    deck.append(Card(str(card_id), suit, rank))
-                    existing_cards.add(card_str)
-                    filler_count += 1
-                    card_id += 1
-            if filler_count >= num_filler:
-                break
-        # Add more unique fillers if needed (e.g., different suits/ranks)
-        while filler_count < num_filler:
-            # This fallback logic might be needed if standard deck runs out quickly
-            # For now, assume 52 cards are enough
-            rank = Rank(filler_count % 13 + 1)  # Cycle through ranks
-            suit = Suit(list(Suit)[filler_count % 4])  # Cycle through suits
-            card_str = f"{rank.value}{suit.value}"
-            if card_str not in existing_cards:
-                deck.append(Card(str(card_id), suit, rank))
-                existing_cards.add(card_str)
-                filler_count += 1
-                card_id += 1
-            else:
-                # If collision, just increment id and try next combo implicitly
-                card_id += 1
-                # Safety break to prevent infinite loop in edge cases
-                if card_id > 1000:
-                    break
+
+        # Fillers take the first num_filler suit/rank pairs in order, with ids
+        # continuing after the hands so they never collide with them
+        first_id = len(deck) + 1
+        for offset, (suit, rank) in enumerate(_FILLER_PAIRS[:num_filler]):
+            deck.append(Card(str(first_id + offset), suit, rank))
 
         return deck
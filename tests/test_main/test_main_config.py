@@ -0,0 +1,121 @@
+"""Tests for the GameConfig path through main.py's setup and wrap-up prompts."""
+
+from unittest.mock import AsyncMock, Mock, patch
+
+import pytest
+
+from main import GameConfig, initialize_game, main as run_main
+
+# Share the session event loop with the scenario tests
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+# Any prompt reached while a GameConfig is in use fails the test
+_NO_PROMPTS = AssertionError("main() prompted despite a GameConfig")
+
+
+class TestMainConfig:
+    @patch("builtins.input", side_effect=_NO_PROMPTS)
+    @patch("main.save_initial_game_state")
+    @patch("main.Game")
+    async def test_config_loads_saved_game(
+        self, mock_game: Mock, mock_save_initial: Mock, mock_input: Mock
+    ) -> None:
+        """Test that load_game loads that file instead of dealing a new game."""
+        config = GameConfig(load_game="saved.json", save_initial=True)
+
+        game = await initialize_game(False, None, config)
+
+        mock_game.assert_called_once_with(load_game="saved.json", ai_player=None)
+        assert game is mock_game.return_value
+        # A loaded game is returned as is, without saving an initial state
+        mock_save_initial.assert_not_called()
+        mock_input.assert_not_called()
+
+    @patch("builtins.input", side_effect=_NO_PROMPTS)
+    @patch("main.save_initial_game_state")
+    @patch("main.Game")
+    async def test_config_saves_initial_state(
+        self, mock_game: Mock, mock_save_initial: Mock, mock_input: Mock
+    ) -> None:
+        """Test that save_initial saves the newly dealt game."""
+        config = GameConfig(manual_selection=True, save_initial=True)
+
+        game = await initialize_game(False, None, config)
+
+        mock_game.assert_called_once_with(manual_selection=True, ai_player=None)
+        mock_save_initial.assert_called_once_with(game)
+        mock_input.assert_not_called()
+
+    @patch("builtins.input", side_effect=_NO_PROMPTS)
+    @patch("main.save_initial_game_state")
+    @patch("main.Game")
+    async def test_default_config_deals_without_saving(
+        self, mock_game: Mock, mock_save_initial: Mock, mock_input: Mock
+    ) -> None:
+        """Test that the default GameConfig deals a random game and saves nothing."""
+        await initialize_game(False, None, GameConfig())
+
+        mock_game.assert_called_once_with(manual_selection=False, ai_player=None)
+        mock_save_initial.assert_not_called()
+        mock_input.assert_not_called()
+
+    @patch("builtins.input", side_effect=_NO_PROMPTS)
+    @patch("main.save_game_history")
+    @patch("main.game_loop", new_callable=AsyncMock, return_value=0)
+    @patch("main.initialize_game", new_callable=AsyncMock)
+    async def test_config_saves_history(
+        self,
+        mock_initialize: AsyncMock,
+        mock_game_loop: AsyncMock,
+        mock_save_history: Mock,
+        mock_input: Mock,
+    ) -> None:
+        """Test that save_history saves the game history once the game ends."""
+        config = GameConfig(save_history=True)
+
+        await run_main(config)
+
+        mock_initialize.assert_awaited_once_with(False, None, config)
+        mock_save_history.assert_called_once()
+        mock_input.assert_not_called()
+
+    @patch("builtins.input", side_effect=_NO_PROMPTS)
+    @patch("main.save_game_history")
+    @patch("main.game_loop", new_callable=AsyncMock, return_value=None)
+    @patch("main.initialize_game", new_callable=AsyncMock)
+    async def test_config_skips_history(
+        self,
+        mock_initialize: AsyncMock,
+        mock_game_loop: AsyncMock,
+        mock_save_history: Mock,
+        mock_input: Mock,
+    ) -> None:
+        """Test that the game history is not saved unless save_history is set."""
+        await run_main(GameConfig())
+
+        mock_save_history.assert_not_called()
+        mock_input.assert_not_called()
+
+    @patch("main.get_yes_no_input")
+    @patch("main.game_loop", new_callable=AsyncMock, return_value=1)
+    @patch("main.initialize_game", new_callable=AsyncMock)
+    @patch("main.AIPlayer")
+    async def test_config_with_ai_plays_a_single_game(
+        self,
+        mock_ai_player: Mock,
+        mock_initialize: AsyncMock,
+        mock_game_loop: AsyncMock,
+        mock_yes_no: Mock,
+    ) -> None:
+        """Test that an AI game run from a GameConfig never offers to play again."""
+        config = GameConfig(use_ai=True)
+
+        await run_main(config)
+
+        mock_initialize.assert_awaited_once_with(
+            True, mock_ai_player.return_value, config
+        )
+        mock_game_loop.assert_awaited_once_with(
+            mock_initialize.return_value, True, mock_ai_player.return_value
+        )
+        mock_yes_no.assert_not_called()
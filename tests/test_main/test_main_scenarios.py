@@ -0,0 +1,26 @@
+"""King, Queen, Six, Three, Jack and Four games driven through main.py."""
+
+import pytest
+
+from tests.test_main.scenarios import SCENARIOS, MainScenario
+from tests.test_main.test_main_base import DeckBuilder, MainTestBase, ScenarioRunner
+
+pytestmark = pytest.mark.e2e
+
+
+class TestMainScenarios(MainTestBase):
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize("scenario", SCENARIOS, ids=lambda s: s.name)
+    async def test_scenario_through_main(
+        self,
+        scenario: MainScenario,
+        make_test_deck: DeckBuilder,
+        run_scenario: ScenarioRunner,
+    ) -> None:
+        """Test playing each scenario through main.py and checking the resulting Game."""
+        # Create test deck with specific cards
+        test_deck = make_test_deck(scenario.p0_cards, scenario.p1_cards)
+
+        # Run the game and check the captured result
+        captured_game = await run_scenario(scenario.mock_inputs, test_deck)
+        scenario.assert_fn(captured_game)
@@ -4,8 +4,10 @@ import pytest
 
 from server.session_store import SessionStore
 
+# Both tests run on the session event loop instead of a fresh loop each
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
 
-@pytest.mark.asyncio
 async def test_create_get_delete_session() -> None:
     store = SessionStore()
 
@@ -22,12 +24,12 @@ async def test_create_get_delete_session() -> None:
     assert await store.session_count() == 0
 
 
-@pytest.mark.asyncio
 async def test_concurrent_session_creation() -> None:
     store = SessionStore()
 
-    tasks = [store.create_session(use_ai=False) for _ in range(10)]
-    sessions = await asyncio.gather(*tasks)
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(store.create_session(use_ai=False)) for _ in range(10)]
+    sessions = [task.result() for task in tasks]
 
     ids = {session.id for session in sessions}
     assert len(ids) == 10